@@ -1,6 +1,24 @@
 from colorama import Fore
 from plugin import plugin, alias
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
+
+
+_VALID_GENDERS = frozenset(('M', 'F'))
+
+_WELCOME_BANNER = (f'{Fore.YELLOW}\nHello! In order to calculate your daily '
+    'calorie intake i will need some information about you. '
+    f'Lets start...{Fore.RESET}')
+
+_ACTIVITY_BANNER = (f'{Fore.YELLOW}\nActivity levels:{Fore.RESET}\n'
+    f'{Fore.YELLOW}[1]{Fore.RESET} Little or no exercise\n'
+    f'{Fore.YELLOW}[2]{Fore.RESET} Light exercise 1-3 days a week\n'
+    f'{Fore.YELLOW}[3]{Fore.RESET} Moderate exercise 4-5 days a week\n'
+    f'{Fore.YELLOW}[4]{Fore.RESET} Hard exercise every day\n')
+
+_GOALS_BANNER = (f'{Fore.YELLOW}\nGoals:{Fore.RESET}\n'
+    f'{Fore.YELLOW}[1]{Fore.RESET} Lose weight\n'
+    f'{Fore.YELLOW}[2]{Fore.RESET} Maintain weight\n'
+    f'{Fore.YELLOW}[3]{Fore.RESET} Gain weight\n')
 
 
 @alias("macros")
@@ -15,8 +33,38 @@ class CaloriesMacrosPlugin:
     class CalorieCalculator:
 
         WEIGHT_LOSS = 1
+        WEIGHT_MAINTENANCE = 2
         WEIGHT_GAIN = 3
 
+        # Indexed by activity level - 1
+        _ACTIVITY_FACTORS = (
+            1.2,    # Little or no exercise
+            1.375,  # Light exercise 1-3 days a week
+            1.55,   # Moderate exercise 4-5 days a week
+            1.725   # Hard exercise every day
+        )
+
+        # Minimum suggested daily calorie intake per gender
+        _MIN_CAL = {'M': 1500, 'F': 1200}
+
+        _UNDER_MSG = {
+            'M': (f'{Fore.CYAN}\nThe calculated daily calorie intake was '
+                'below the suggested of 1500 cal for males. We suggest you to '
+                'consult a nutrition expert to help you achieve your goal!'),
+            'F': (f'{Fore.CYAN}\nThe calculated daily calorie intake was '
+                'below the suggested of 1200 cal for females. We suggest you '
+                'to consult a nutrition expert to help you achieve your goal!')
+        }
+
+        _GOAL_MSG = {
+            WEIGHT_LOSS: ('\nThe recommended daily calorie intake to achieve a '
+                f'weight loss of ~0.5kg/week is: {Fore.YELLOW}{{0}}'),
+            WEIGHT_MAINTENANCE: ('\nThe recommended daily calorie intake to '
+                f'maintain your current weight is: {Fore.YELLOW}{{0}}'),
+            WEIGHT_GAIN: ('\nThe recommended daily calorie intake to achieve a '
+                f'weight gain of ~0.5kg/week is: {Fore.YELLOW}{{0}}')
+        }
+
         def __init__(self, gender: str, age: int, height: int, weight: int,
                 activity_level: int, goal: int) -> None:
             self._gender = gender
@@ -25,6 +73,8 @@ class CaloriesMacrosPlugin:
             self._weight = weight
             self._activity_level = activity_level
             self._goal = goal
+            # Mifflin-St Jeor gender constant, see _calc_rmr
+            self._gender_constant = 5 if gender == 'M' else -161
 
         def _calc_rmr(self) -> float:
             """
@@ -43,19 +93,8 @@ class CaloriesMacrosPlugin:
                 https://www.medicalnewstoday.com/articles/macro-diet
             """
 
-            WEIGHT_FACTOR = 10
-            HEIGHT_FACTOR = 6.25
-            AGE_FACTOR = -5
-            MALE_CONSTANT = 5
-            FEMALE_CONSTANT = -161
-
-            if self._gender == 'M':
-                gender_constant = MALE_CONSTANT
-            else:
-                gender_constant = FEMALE_CONSTANT
-
-            return (WEIGHT_FACTOR * self._weight + HEIGHT_FACTOR * self._height
-                + AGE_FACTOR * self._age + gender_constant)
+            return (10 * self._weight + 6.25 * self._height - 5 * self._age
+                + self._gender_constant)
 
         def _calc_tdee(self, rmr: float) -> int:
             """
@@ -69,14 +108,7 @@ class CaloriesMacrosPlugin:
             Source: https://www.medicalnewstoday.com/articles/macro-diet
             """
 
-            ACTIVITY_FACTORS = {
-                1: 1.2,    # Little or no exercise
-                2: 1.375,  # Light exercise 1-3 days a week
-                3: 1.55,   # Moderate exercise 4-5 days a week
-                4: 1.725   # Hard exercise every day
-            }
-
-            return round(rmr * ACTIVITY_FACTORS.get(self._activity_level))
+            return round(rmr * self._ACTIVITY_FACTORS[self._activity_level - 1])
 
         def _calc_daily_calorie_intake(self, tdee: int) -> int:
             DAILY_CALORIC_DEFICIT = 500  # Results to ~0.5kg/week weight loss
@@ -100,30 +132,11 @@ class CaloriesMacrosPlugin:
             and men get at least 1,500 calories a day unless supervised by doctors.
             """
 
-            MIN_SUGGESTED_MALE_CAL_INTAKE = 1500
-            MIN_SUGGESTED_FEMALE_CAL_INTAKE = 1200
-
-            if self._gender == 'M' and cal_intake < MIN_SUGGESTED_MALE_CAL_INTAKE:
-                jarvis.say(f'{Fore.CYAN}\nThe calculated daily calorie intake was '
-                    'below the suggested of 1500 cal for males. We suggest you to '
-                    'consult a nutrition expert to help you achieve your goal!')
-                exit()
-
-            if self._gender == 'F' and cal_intake < MIN_SUGGESTED_FEMALE_CAL_INTAKE:
-                jarvis.say(f'{Fore.CYAN}\nThe calculated daily calorie intake was '
-                    'below the suggested of 1200 cal for females. We suggest you '
-                    'to consult a nutrition expert to help you achieve your goal!')
+            if cal_intake < self._MIN_CAL[self._gender]:
+                jarvis.say(self._UNDER_MSG[self._gender])
                 exit()
 
-            if self._goal == self.WEIGHT_LOSS:
-                jarvis.say('\nThe recommended daily calorie intake to achieve a '
-                    f'weight loss of ~0.5kg/week is: {Fore.YELLOW}{cal_intake}')
-            elif self._goal == self.WEIGHT_GAIN:
-                jarvis.say('\nThe recommended daily calorie intake to achieve a '
-                    f'weight gain of ~0.5kg/week is: {Fore.YELLOW}{cal_intake}')
-            else:
-                jarvis.say('\nThe recommended daily calorie intake to maintain '
-                    f'your current weight is: {Fore.YELLOW}{cal_intake}')
+            jarvis.say(self._GOAL_MSG[self._goal].format(cal_intake))
 
     class MacronutrientCalculator:
 
@@ -227,50 +240,39 @@ class CaloriesMacrosPlugin:
         return f'{Fore.RED}{content}{Fore.RESET}'
 
     def display_welcome_message(self, jarvis) -> None:
-        jarvis.say(self.yellow(
-            '\nHello! In order to calculate your daily calorie intake '
-            'i will need some information about you. Lets start...'))
+        jarvis.say(_WELCOME_BANNER)
 
     def display_activity_levels(self, jarvis) -> None:
-        jarvis.say(self.yellow("\nActivity levels:"))
-        jarvis.say(f'{self.yellow("[1]")} Little or no exercise')
-        jarvis.say(f'{self.yellow("[2]")} Light exercise 1-3 days a week')
-        jarvis.say(f'{self.yellow("[3]")} Moderate exercise 4-5 days a week')
-        jarvis.say(f'{self.yellow("[4]")} Hard exercise every day\n')
+        jarvis.say(_ACTIVITY_BANNER)
 
     def display_goals(self, jarvis) -> None:
-        jarvis.say(self.yellow("\nGoals:"))
-        jarvis.say(f'{self.yellow("[1]")} Lose weight')
-        jarvis.say(f'{self.yellow("[2]")} Maintain weight')
-        jarvis.say(f'{self.yellow("[3]")} Gain weight\n')
+        jarvis.say(_GOALS_BANNER)
 
     def read_gender(self, jarvis, input_message: str, error_message: str) -> str:
         while True:
-            gender = jarvis.input(input_message)
-            if self.validate_gender(gender):
-                return gender.upper()
+            gender = jarvis.input(input_message).upper()
+            if gender in _VALID_GENDERS:
+                return gender
             jarvis.say(self.red(error_message))
 
-    def validate_gender(self, gender: str) -> bool:
-        return (gender.upper() == "M" or gender.upper() == "F")
-
     def read_input(self, jarvis, input_message: str,
             bool_expression: Callable[[int], bool], error_message: str) -> int:
         while True:
-            input = jarvis.input(input_message)
-            if self.validate_input(input, bool_expression):
-                return int(input)
+            value = self._try_parse(jarvis.input(input_message), bool_expression)
+            if value is not None:
+                return value
             jarvis.say(self.red(error_message))
 
-    def validate_input(self, input: str,
-            bool_expression: Callable[[int], bool]) -> bool:
+    def _try_parse(self, input: str,
+            bool_expression: Callable[[int], bool]) -> Optional[int]:
         try:
-            input = int(input)
-            if bool_expression(input):
-                return True
-            return False
+            value = int(input)
         except ValueError:
-            return False
+            return None
+
+        if bool_expression(value):
+            return value
+        return None
 
     def read_use_default_macro_ratios(self, jarvis) -> bool:
         input = jarvis.input('\nThe recommended macronutrients will be '
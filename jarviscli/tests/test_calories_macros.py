@@ -35,94 +35,83 @@ class CaloriesMacrosPluginTest(PluginTest):
             fat_ratio=0.2
         )
 
-    def test_validate_gender_valid(self):
-        # Male (m/M)
-        self.assertTrue(self.test.validate_gender("m"))
-        self.assertTrue(self.test.validate_gender("M"))
-
-        # Female (f/F)
-        self.assertTrue(self.test.validate_gender("f"))
-        self.assertTrue(self.test.validate_gender("F"))
-
-    def test_validate_gender_invalid(self):
-        # Anything other than Male (m/M) or Female (f/F)
-        self.assertFalse(self.test.validate_gender("7"))
-        self.assertFalse(self.test.validate_gender("s"))
-
-    def test_validate_input_age_valid(self):
+    def test__try_parse_age_valid(self):
         bool_expression: Callable[[int], bool] = lambda age: age >= 14
 
         # Anything greater than or equal to 14
-        self.assertTrue(self.test.validate_input("14", bool_expression))
-        self.assertTrue(self.test.validate_input("77", bool_expression))
+        self.assertEqual(self.test._try_parse("14", bool_expression), 14)
+        self.assertEqual(self.test._try_parse("77", bool_expression), 77)
 
-    def test_validate_input_age_invalid(self):
+    def test__try_parse_age_invalid(self):
         bool_expression: Callable[[int], bool] = lambda age: age >= 14
 
         # Anything less than 14
-        self.assertFalse(self.test.validate_input("13", bool_expression))
-        self.assertFalse(self.test.validate_input("-1", bool_expression))
+        self.assertIsNone(self.test._try_parse("13", bool_expression))
+        self.assertIsNone(self.test._try_parse("-1", bool_expression))
 
-    def test_validate_input_height_valid(self):
+        # Anything that is not an integer
+        self.assertIsNone(self.test._try_parse("s", bool_expression))
+
+    def test__try_parse_height_valid(self):
         bool_expression: Callable[[int], bool] = lambda height: height > 0
 
         # Anything greater than 0
-        self.assertTrue(self.test.validate_input("1", bool_expression))
-        self.assertTrue(self.test.validate_input("177", bool_expression))
+        self.assertEqual(self.test._try_parse("1", bool_expression), 1)
+        self.assertEqual(self.test._try_parse("177", bool_expression), 177)
 
-    def test_validate_input_height_invalid(self):
+    def test__try_parse_height_invalid(self):
         bool_expression: Callable[[int], bool] = lambda height: height > 0
 
         # Anything less than or equal to 0
-        self.assertFalse(self.test.validate_input("0", bool_expression))
-        self.assertFalse(self.test.validate_input("-1", bool_expression))
+        self.assertIsNone(self.test._try_parse("0", bool_expression))
+        self.assertIsNone(self.test._try_parse("-1", bool_expression))
 
-    def test_validate_input_weight_valid(self):
+    def test__try_parse_weight_valid(self):
         bool_expression: Callable[[int], bool] = lambda weight: weight > 0
 
         # Anything greater than 0
-        self.assertTrue(self.test.validate_input("1", bool_expression))
-        self.assertTrue(self.test.validate_input("77", bool_expression))
+        self.assertEqual(self.test._try_parse("1", bool_expression), 1)
+        self.assertEqual(self.test._try_parse("77", bool_expression), 77)
 
-    def test_validate_input_weight_invalid(self):
+    def test__try_parse_weight_invalid(self):
         bool_expression: Callable[[int], bool] = lambda weight: weight > 0
 
         # Anything less than or equal to 0
-        self.assertFalse(self.test.validate_input("0", bool_expression))
-        self.assertFalse(self.test.validate_input("-1", bool_expression))
+        self.assertIsNone(self.test._try_parse("0", bool_expression))
+        self.assertIsNone(self.test._try_parse("-1", bool_expression))
 
-    def test_validate_input_workout_level_valid(self):
+    def test__try_parse_workout_level_valid(self):
         bool_expression: Callable[[int], bool] = \
             lambda workout_level: 1 <= workout_level <= 4
 
         # Anything between 1 to 4
-        self.assertTrue(self.test.validate_input("1", bool_expression))
-        self.assertTrue(self.test.validate_input("2", bool_expression))
-        self.assertTrue(self.test.validate_input("3", bool_expression))
-        self.assertTrue(self.test.validate_input("4", bool_expression))
+        self.assertEqual(self.test._try_parse("1", bool_expression), 1)
+        self.assertEqual(self.test._try_parse("2", bool_expression), 2)
+        self.assertEqual(self.test._try_parse("3", bool_expression), 3)
+        self.assertEqual(self.test._try_parse("4", bool_expression), 4)
 
-    def test_validate_workout_level_invalid(self):
+    def test__try_parse_workout_level_invalid(self):
         bool_expression: Callable[[int], bool] = \
             lambda workout_level: 1 <= workout_level <= 4
 
         # Anything other than the values 1 through 4
-        self.assertFalse(self.test.validate_input("0", bool_expression))
-        self.assertFalse(self.test.validate_input("5", bool_expression))
+        self.assertIsNone(self.test._try_parse("0", bool_expression))
+        self.assertIsNone(self.test._try_parse("5", bool_expression))
 
-    def test_validate_input_goal_valid(self):
+    def test__try_parse_goal_valid(self):
         bool_expression: Callable[[int], bool] = lambda goal: 1 <= goal <= 3
 
         # Anything between 1 to 3
-        self.assertTrue(self.test.validate_input("1", bool_expression))
-        self.assertTrue(self.test.validate_input("2", bool_expression))
-        self.assertTrue(self.test.validate_input("3", bool_expression))
+        self.assertEqual(self.test._try_parse("1", bool_expression), 1)
+        self.assertEqual(self.test._try_parse("2", bool_expression), 2)
+        self.assertEqual(self.test._try_parse("3", bool_expression), 3)
 
-    def test_validate_goal_invalid(self):
+    def test__try_parse_goal_invalid(self):
         bool_expression: Callable[[int], bool] = lambda goal: 1 <= goal <= 3
 
         # Anything other than the values 1 through 3
-        self.assertFalse(self.test.validate_input("0", bool_expression))
-        self.assertFalse(self.test.validate_input("4", bool_expression))
+        self.assertIsNone(self.test._try_parse("0", bool_expression))
+        self.assertIsNone(self.test._try_parse("4", bool_expression))
 
     def test_validate_macro_ratios_valid(self):
         # Protein ratio at the lower bound and sum equal to 1
@@ -337,36 +326,22 @@ class CaloriesMacrosPluginTest(PluginTest):
         self.test.display_activity_levels(self.jarvis_api)
 
         self.assertEqual(
-            self.history_say().view_text(0),
-            self.test.yellow("\nActivity levels:"))
-        self.assertEqual(
-            self.history_say().view_text(1),
-            f'{self.test.yellow("[1]")} Little or no exercise')
-        self.assertEqual(
-            self.history_say().view_text(2),
-            f'{self.test.yellow("[2]")} Light exercise 1-3 days a week')
-        self.assertEqual(
-            self.history_say().view_text(3),
-            f'{self.test.yellow("[3]")} Moderate exercise 4-5 days a week')
-        self.assertEqual(
-            self.history_say().view_text(4),
-            f'{self.test.yellow("[4]")} Hard exercise every day')
+            self.history_say().last_text(),
+            (self.test.yellow("\nActivity levels:") + '\n'
+            f'{self.test.yellow("[1]")} Little or no exercise\n'
+            f'{self.test.yellow("[2]")} Light exercise 1-3 days a week\n'
+            f'{self.test.yellow("[3]")} Moderate exercise 4-5 days a week\n'
+            f'{self.test.yellow("[4]")} Hard exercise every day'))
 
     def test_display_goals(self):
         self.test.display_goals(self.jarvis_api)
 
         self.assertEqual(
-            self.history_say().view_text(0),
-            self.test.yellow("\nGoals:"))
-        self.assertEqual(
-            self.history_say().view_text(1),
-            f'{self.test.yellow("[1]")} Lose weight')
-        self.assertEqual(
-            self.history_say().view_text(2),
-            f'{self.test.yellow("[2]")} Maintain weight')
-        self.assertEqual(
-            self.history_say().view_text(3),
-            f'{self.test.yellow("[3]")} Gain weight')
+            self.history_say().last_text(),
+            (self.test.yellow("\nGoals:") + '\n'
+            f'{self.test.yellow("[1]")} Lose weight\n'
+            f'{self.test.yellow("[2]")} Maintain weight\n'
+            f'{self.test.yellow("[3]")} Gain weight'))
 
     def test__calc_rmr(self):
         self.assertEqual(self.cal_calc_m._calc_rmr(), 1658.75)